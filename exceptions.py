@@ -17,3 +17,9 @@ class EndPointError(Exception):
     """Ошибка в доступе к ENDPOINT."""
 
     pass
+
+
+class ConfigError(Exception):
+    """Не заданы обязательные переменные окружения."""
+
+    pass
@@ -6,23 +6,68 @@
 
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import random
+import socket
 import sys
 import time
+from dataclasses import dataclass
 from http import HTTPStatus
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
 
 import requests
 import telegram
 from dotenv import load_dotenv
-
-from exceptions import EndPointError, EndpointStatusError, SendMessageError
+from requests.adapters import HTTPAdapter
+from requests.utils import select_proxy
+from urllib3.util.retry import Retry
+
+from exceptions import (
+    ConfigError,
+    EndPointError,
+    EndpointStatusError,
+    SendMessageError,
+)
 
 load_dotenv()
 
-# Конфигурация корневого логгера: вывод DEBUG-сообщений в файл debug.log
-logging.basicConfig(level=logging.DEBUG, filename="debug.log", filemode="w")
+# Создание форматтера для задания формата сообщений
+formatter = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+# Обработчик для записи всех сообщений (от DEBUG и выше) в файл debug.log
+file_handler = logging.FileHandler("debug.log", mode="w")
+file_handler.setFormatter(formatter)
+
+# Создание обработчика (handler) для вывода сообщений в консоль;
+# в консоль попадают только предупреждения и ошибки
+stream_handler = logging.StreamHandler(stream=sys.stdout)
+stream_handler.setLevel(logging.WARNING)
+stream_handler.setFormatter(formatter)
+
+# Запись в файл и консоль выполняется в отдельном потоке: цикл опроса
+# только кладет запись в очередь и не ждет дискового ввода-вывода
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(
+    log_queue, file_handler, stream_handler, respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+# Конфигурация корневого логгера: все сообщения уходят в очередь
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.DEBUG)
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+# Отладочные сообщения HTTP-клиента о каждом запросе не нужны в логе
+logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 # Создание экземпляра логгера для текущего модуля
 logger = logging.getLogger(__name__)
@@ -31,49 +76,300 @@ logger = logging.getLogger(__name__)
 # т.е. он будет выводить сообщения с уровнем INFO и выше
 logger.setLevel(logging.INFO)
 
-# Создание обработчика (handler) для вывода сообщений в консоль
-handler = logging.StreamHandler(stream=sys.stdout)
-
-# Создание форматтера для задания формата сообщений
-formatter = logging.Formatter(
-    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-
-# Установка форматтера на обработчик
-handler.setFormatter(formatter)
-
-# Добавление обработчика в логгер
-logger.addHandler(handler)
-
 
 PRACTICUM_TOKEN: Optional[str] = os.getenv("PRACTICUM_TOKEN")
 TELEGRAM_TOKEN: Optional[str] = os.getenv("TELEGRAM_TOKEN")
 TELEGRAM_CHAT_ID: Optional[str] = os.getenv("TELEGRAM_CHAT_ID")
 
 RETRY_PERIOD: int = 600
+# Верхняя граница паузы между опросами при повторяющихся сбоях
+MAX_RETRY_PERIOD: int = 3600
+# Случайная добавка к паузе, чтобы клиенты не опрашивали API синхронно
+RETRY_JITTER: int = 30
+# Сколько сбоев API подряд переводят прерыватель в состояние "open"
+BREAKER_THRESHOLD: int = 3
+# Сколько секунд прерыватель не пропускает запросы после открытия
+BREAKER_COOLDOWN: int = MAX_RETRY_PERIOD
 ENDPOINT: str = "https://practicum.yandex.ru/api/user_api/homework_statuses/"
-HEADERS: dict = {"Authorization": f"OAuth {PRACTICUM_TOKEN}"}
+# Постоянные заголовки запроса к API; заголовок авторизации добавляется
+# только в Config, который собирает load_config() после проверки токена
+HEADERS: Mapping[str, str] = MappingProxyType({"Accept": "application/json"})
+# Как долго (в секундах) используется закэшированный IP-адрес API
+DNS_CACHE_TTL: int = RETRY_PERIOD * 6
+# Таймауты запроса к API: (подключение, чтение), в секундах
+REQUEST_TIMEOUT: Tuple[int, int] = (5, 30)
+
+# Ожидаемые сбои опроса API, для которых не нужна трассировка стека
+EXPECTED_ERRORS: Tuple[type, ...] = (
+    EndPointError,
+    EndpointStatusError,
+    ConnectionError,
+)
+
+# Сессия с пулом keep-alive соединений, создается в main()
+SESSION: Optional[requests.Session] = None
+
+# Словарь вердиктов доступен только для чтения
+HOMEWORK_VERDICTS: Mapping[str, str] = MappingProxyType(
+    {
+        "approved": "Работа проверена: ревьюеру всё понравилось. Ура!",
+        "reviewing": "Работа взята на проверку ревьюером.",
+        "rejected": "Работа проверена: у ревьюера есть замечания.",
+    }
+)
+# Максимальная длина одного сообщения в Telegram
+TELEGRAM_MESSAGE_LIMIT: int = 4096
+# Обязательные ключи записи о домашней работе в ответе API
+HOMEWORK_KEYS: Tuple[str, str] = ("homework_name", "status")
+# Метка работы, статус которой бот еще не обрабатывал
+NOT_SEEN: object = object()
+STATUS_MESSAGE: str = (
+    'Изменился статус проверки работы "{homework_name}". {verdict}'
+)
+
 
-HOMEWORK_VERDICTS: dict = {
-    "approved": "Работа проверена: ревьюеру всё понравилось. Ура!",
-    "reviewing": "Работа взята на проверку ревьюером.",
-    "rejected": "Работа проверена: у ревьюера есть замечания.",
-}
+@dataclass(frozen=True)
+class Config:
+    """Проверенная конфигурация доступа к API Практикума."""
+
+    # slots=True в декораторе доступен только с Python 3.10
+    __slots__ = ("headers",)
+
+    headers: Dict[str, str]
+
+
+class CachedDNSAdapter(HTTPAdapter):
+    """
+    HTTPS-адаптер, который кэширует IP-адрес хоста между запросами.
+
+    Имя хоста разрешается один раз и обновляется не чаще, чем раз в
+    `dns_ttl` секунд или после ошибки соединения. Пул соединений
+    открывается на IP-адрес, а заголовок Host, SNI и проверка
+    TLS-сертификата используют исходное имя хоста.
+    """
+
+    def __init__(
+        self, *args: Any, dns_ttl: float = DNS_CACHE_TTL, **kwargs: Any
+    ) -> None:
+        """Создает адаптер с пустым кэшем адресов."""
+        self.dns_ttl = dns_ttl
+        self.resolved: Dict[str, Tuple[str, float]] = {}
+        super().__init__(*args, **kwargs)
+
+    def resolve(self, host: str) -> str:
+        """Возвращает IP-адрес хоста из кэша или из DNS."""
+        address, resolved_at = self.resolved.get(host, ("", 0.0))
+        if not address or time.monotonic() - resolved_at > self.dns_ttl:
+            address = socket.gethostbyname(host)
+            self.resolved[host] = (address, time.monotonic())
+        return address
+
+    def get_connection(
+        self, url: str, proxies: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """Возвращает пул соединений с закэшированным IP-адресом хоста."""
+        parsed = urlsplit(url)
+        host = parsed.hostname
+        if (
+            parsed.scheme != "https"
+            or not host
+            or select_proxy(url, proxies)
+        ):
+            return super().get_connection(url, proxies)
+
+        try:
+            address = self.resolve(host)
+        except OSError as e:
+            # Без кэша имя будет разрешено обычным способом
+            logger.warning("Не удалось разрешить имя %s: %s", host, e)
+            return super().get_connection(url, proxies)
+
+        # Имя хоста передается только в этот пул, а не в общие
+        # настройки менеджера пулов
+        return self.poolmanager.connection_from_host(
+            address,
+            port=parsed.port,
+            scheme=parsed.scheme,
+            pool_kwargs={"server_hostname": host, "assert_hostname": host},
+        )
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        """Отправляет запрос, указывая исходное имя хоста в заголовке Host."""
+        url = urlsplit(request.url)
+        if not url.hostname or select_proxy(
+            request.url, kwargs.get("proxies")
+        ):
+            return super().send(request, **kwargs)
+
+        request.headers["Host"] = url.netloc.rpartition("@")[2]
+        try:
+            return super().send(request, **kwargs)
+        except requests.ConnectionError:
+            # Адрес мог устареть: следующий запрос разрешит имя заново
+            self.resolved.pop(url.hostname, None)
+            raise
+        finally:
+            del request.headers["Host"]
+
+
+class CircuitBreaker:
+    """
+    Прерыватель опроса API при повторяющихся сбоях API.
+
+    Состояния:
+    - "closed" - опрос раз в RETRY_PERIOD, после каждого сбоя пауза
+      растет экспоненциально (до MAX_RETRY_PERIOD) со случайной добавкой;
+    - "open" - после `threshold` сбоев подряд запросы не выполняются
+      ровно `cooldown` секунд;
+    - "half-open" - после паузы выполняется один пробный запрос: успех
+      закрывает прерыватель, сбой снова открывает его на `cooldown` секунд.
+    """
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN,
+    ) -> None:
+        """Создает прерыватель в состоянии "closed"."""
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Проверяет, можно ли сейчас выполнить запрос к API."""
+        if self.state == "open":
+            if self.remaining() > 0:
+                return False
+            self.state = "half-open"
+            logger.info("Пробный запрос к API после паузы.")
+        return True
+
+    def remaining(self) -> float:
+        """Возвращает, сколько секунд осталось до конца паузы "open"."""
+        return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+    def record_success(self) -> None:
+        """Закрывает прерыватель после успешного цикла опроса."""
+        if self.state != "closed":
+            logger.info("Опрос API восстановлен.")
+        self.state = "closed"
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        """Учитывает сбой API и при необходимости открывает прерыватель."""
+        self.failures += 1
+        if self.state == "half-open":
+            logger.error(
+                "Пробный запрос к API не удался. "
+                "Опрос API приостановлен на %s с.",
+                self.cooldown,
+            )
+        elif self.failures >= self.threshold:
+            logger.error(
+                "Сбоев подряд: %s. Опрос API приостановлен на %s с.",
+                self.failures,
+                self.cooldown,
+            )
+        else:
+            return
+        self.state = "open"
+        self.opened_at = time.monotonic()
+
+    def delay(self) -> float:
+        """Возвращает паузу в секундах перед следующим циклом опроса."""
+        if self.state == "open":
+            return self.remaining()
+        if not self.failures:
+            return RETRY_PERIOD
+
+        backoff = min(RETRY_PERIOD * 2 ** self.failures, MAX_RETRY_PERIOD)
+        return backoff + random.uniform(0, RETRY_JITTER)
 
 
 def check_tokens() -> bool:
     """Проверяет доступность переменных окружения.
 
     Проверяет, что обязательные переменные окружения PRACTICUM_TOKEN,
-    TELEGRAM_TOKEN и TELEGRAM_CHAT_ID заполнены.
+    TELEGRAM_TOKEN и TELEGRAM_CHAT_ID заполнены, и логирует
+    отсутствующие с уровнем CRITICAL.
 
     """
-    token_data = [
-        ("PRACTICUM_TOKEN", PRACTICUM_TOKEN),
-        ("TELEGRAM_TOKEN", TELEGRAM_TOKEN),
-        ("TELEGRAM_CHAT_ID", TELEGRAM_CHAT_ID),
+    missing = [
+        name
+        for name, value in (
+            ("PRACTICUM_TOKEN", PRACTICUM_TOKEN),
+            ("TELEGRAM_TOKEN", TELEGRAM_TOKEN),
+            ("TELEGRAM_CHAT_ID", TELEGRAM_CHAT_ID),
+        )
+        if not value
     ]
-    return all(value for _, value in token_data)
+    if missing:
+        logging.critical(
+            "Отсутствуют обязательные переменные окружения: %s",
+            ", ".join(missing),
+        )
+        return False
+    return True
+
+
+def load_config() -> Config:
+    """
+    Собирает конфигурацию из проверенных переменных окружения.
+
+    Заголовок авторизации собирается только после проверки токена
+    и дополняет постоянные заголовки из HEADERS.
+
+    Raises:
+        ConfigError: Если обязательные переменные окружения не заполнены.
+
+    Returns:
+        Config: Конфигурация с готовым заголовком авторизации.
+
+    """
+    if not check_tokens():
+        raise ConfigError("Не заданы обязательные переменные окружения.")
+
+    return Config(
+        headers={**HEADERS, "Authorization": f"OAuth {PRACTICUM_TOKEN}"}
+    )
+
+
+def build_session(cfg: Config) -> requests.Session:
+    """
+    Создает сессию для запросов к API Практикума.
+
+    Сессия хранит заголовок авторизации и переиспользует TCP/TLS-соединение
+    между опросами, поэтому рукопожатие выполняется только один раз,
+    а IP-адрес API кэшируется на DNS_CACHE_TTL секунд.
+    Ответы 5xx и сетевые ошибки повторяются до трех раз с экспоненциальной
+    задержкой.
+
+    Args:
+        cfg (Config): Конфигурация с заголовком авторизации.
+
+    Returns:
+        requests.Session: Настроенная сессия с пулом соединений.
+
+    """
+    session = requests.Session()
+    session.headers.update(cfg.headers)
+    retries = Retry(
+        total=3,
+        backoff_factor=2,
+        status_forcelist=[500, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    session.mount(
+        "https://",
+        CachedDNSAdapter(
+            pool_connections=1, pool_maxsize=4, max_retries=retries
+        ),
+    )
+    return session
 
 
 def send_message(bot: telegram.Bot, message: str) -> None:
@@ -92,10 +388,10 @@ def send_message(bot: telegram.Bot, message: str) -> None:
     """
     try:
         bot.send_message(TELEGRAM_CHAT_ID, message)
-        logging.debug(f"Отправлено сообщение: {message}")
+        logging.debug("Отправлено сообщение: %s", message)
     except telegram.error.TelegramError as e:
         logging.error(
-            f"Сообщение не удалось отправить: {message}. Причина: {e}"
+            "Сообщение не удалось отправить: %s. Причина: %s", message, e
         )
         raise SendMessageError(f"Не удалось отправить сообщение: {e}")
 
@@ -111,38 +407,40 @@ def get_api_answer(timestamp: int) -> Dict:
         EndpointStatusError: Если эндпоинт недоступен или возвращает ошибку.
         KeyError: Если отсутствуют ожидаемые ключи.
         EndPointError: Если произошла ошибка доступа к эндпоинту.
+        ConfigError: Если сессия еще не создана, а токен не задан.
 
     Returns:
         dict: Словарь, содержащий ответ от API в формате .json.
 
     """
+    global SESSION
+    if SESSION is None:
+        SESSION = build_session(load_config())
+
     payload = {"from_date": timestamp}
 
     try:
-        response = requests.get(ENDPOINT, headers=HEADERS, params=payload)
+        response = SESSION.get(
+            ENDPOINT, params=payload, timeout=REQUEST_TIMEOUT
+        )
         if response.status_code != HTTPStatus.OK:
             message = (
                 f"Не удалось получить ответ от {ENDPOINT} "
                 f"с параметрами {payload.values()}. "
                 f"Код запроса - {response.status_code}."
             )
-            logger.error(message)
             raise EndpointStatusError(message)
 
         return response.json()
 
     except requests.RequestException as e:
-        message = f"Ошибка выполнения запроса к {ENDPOINT}: {e}"
-        logging.error(message, exc_info=True)
-        raise EndPointError(message)
+        raise EndPointError(f"Ошибка выполнения запроса к {ENDPOINT}: {e}")
 
     except ConnectionError as e:
-        message = (
+        raise ConnectionError(
             f"Не удалось установить соединение с {ENDPOINT}:"
             f" {e}. Проверьте интернет-соединение."
         )
-        logger.error(message, exc_info=True)
-        raise ConnectionError(message)
 
 
 def check_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -152,7 +450,7 @@ def check_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
     - проверяет, что полученный объект является словарем;
     - проверяет, что значение по ключу "homeworks" является списком словарей;
     - проверяет, что значение по ключу "current_date" является целым числом;
-    - проверяет, что ключ "homeworks" в словаре не отсутствует;
+    - проверяет, что ключи "homeworks" и "current_date" присутствуют;
 
     Args:
         response (dict): Принимает ответ от API в виде словаря.
@@ -165,28 +463,36 @@ def check_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: Если ответ корректный, то возвращает список
         словарей с данными по домашним заданиям.
     """
-    if not isinstance(response, dict):
-        logger.error(f"Ожидаемый тип данных - dict, получен {type(response)}.")
-        raise TypeError("Тип данных не является словарем.")
-
-    if "homeworks" not in response:
-        logger.error("Ответ API не содержит ключа 'homeworks'")
-        raise KeyError("Ответ API не содержит ключа 'homeworks'")
-
-    homeworks = response["homeworks"]
-    current_date = response["current_date"]
+    if type(response) is not dict:
+        raise TypeError(
+            "Тип данных не является словарем: "
+            f"получен {type(response).__name__}."
+        )
 
-    if not isinstance(homeworks, list):
-        logger.error(f"Ожидаемый тип данных - list, получен {type(response)}.")
-        raise TypeError("Тип данных не является списком словарей.")
+    try:
+        homeworks = response["homeworks"]
+        current_date = response["current_date"]
+    except KeyError as e:
+        raise KeyError(f"Ответ API не содержит ключа {e}") from e
+
+    if type(homeworks) is not list:
+        raise TypeError(
+            "Значение 'homeworks' не является списком словарей: "
+            f"получен {type(homeworks).__name__}."
+        )
 
-    elif not all(isinstance(item, dict) for item in homeworks):
-        logger.error("Ожидаемый тип данных - list of dict.")
-        raise TypeError("Тип данных не является списком словарей.")
+    for item in homeworks:
+        if type(item) is not dict:
+            raise TypeError(
+                "Значение 'homeworks' не является списком словарей: "
+                f"получен элемент {type(item).__name__}."
+            )
 
-    elif not isinstance(current_date, int):
-        logger.error(f"Ожидаемый тип данных - int, получен {type(response)}.")
-        raise TypeError("Тип данных не является целым числом.")
+    if type(current_date) is not int:
+        raise TypeError(
+            "Значение 'current_date' не является целым числом: "
+            f"получен {type(current_date).__name__}."
+        )
 
     return homeworks
 
@@ -208,57 +514,175 @@ def parse_status(homework: Dict[str, str]) -> str:
         или "status", либо статус неизвестен.
 
     """
-    required_keys = {"homework_name", "status"}
-    if not required_keys.issubset(homework):
-        missing_keys = required_keys - set(homework.keys())
-        logger.error(f"Отсутствуют ключи {missing_keys} в словаре 'homework'")
+    homework_name = homework.get("homework_name")
+    homework_status = homework.get("status")
+    if homework_name is None or homework_status is None:
+        missing_keys = [
+            key for key in HOMEWORK_KEYS if homework.get(key) is None
+        ]
         raise KeyError(
             f"Отсутствуют ключи {missing_keys} в словаре 'homework'"
         )
 
-    homework_status = homework["status"]
-    if homework_status not in HOMEWORK_VERDICTS:
-        logger.error(f"Неизвестный статус - {homework_status}")
+    verdict = HOMEWORK_VERDICTS.get(homework_status)
+    if verdict is None:
         raise KeyError(f"Неизвестный статус - {homework_status}")
 
-    verdict = HOMEWORK_VERDICTS[homework_status]
-
-    message = (
-        f"Изменился статус проверки работы "
-        f'"{homework["homework_name"]}". {verdict}'
+    message = STATUS_MESSAGE.format(
+        homework_name=homework_name, verdict=verdict
     )
     logger.info(message)
     return message
 
 
+def chunk_messages(
+    messages: List[str],
+    limit: int = TELEGRAM_MESSAGE_LIMIT,
+    sep: str = "\n\n",
+) -> List[str]:
+    """
+    Склеивает сообщения в блоки, умещающиеся в одно сообщение Telegram.
+
+    Args:
+        messages (List[str]): Сообщения в порядке отправки.
+        limit (int): Максимальная длина блока в символах.
+        sep (str): Разделитель между сообщениями внутри блока.
+
+    Returns:
+        List[str]: Блоки текста длиной не более `limit` символов
+        (если отдельное сообщение не длиннее лимита).
+
+    """
+    chunks: List[str] = []
+    current = ""
+    for message in messages:
+        if current and len(current) + len(sep) + len(message) > limit:
+            chunks.append(current)
+            current = message
+        else:
+            current = f"{current}{sep}{message}" if current else message
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def send_status_updates(
+    bot: telegram.Bot,
+    homeworks: List[Dict[str, Any]],
+    last_statuses: Dict[Any, Optional[str]],
+) -> None:
+    """
+    Отправляет одним сообщением все изменившиеся статусы работ.
+
+    Статус каждой работы отправляется один раз. Работы, статус которых
+    не удалось разобрать, логируются и запоминаются, чтобы не мешать
+    отправке остальных.
+
+    Args:
+        bot (telegram.Bot): Объект бота, который отправляет сообщение.
+        homeworks (List[Dict[str, Any]]): Работы из ответа API.
+        last_statuses (Dict[Any, Optional[str]]): Последние обработанные
+            статусы по идентификатору работы; обновляется после отправки.
+
+    Raises:
+        SendMessageError: Если сообщение не удалось отправить.
+
+    """
+    changed: Dict[Any, Optional[str]] = {}
+    messages: List[str] = []
+    for homework in homeworks:
+        homework_id = homework.get("id", homework.get("homework_name"))
+        homework_status = homework.get("status")
+        if last_statuses.get(homework_id, NOT_SEEN) == homework_status:
+            continue
+
+        try:
+            messages.append(parse_status(homework))
+        except KeyError as e:
+            logger.error("Работа %s пропущена: %s", homework_id, e)
+        changed[homework_id] = homework_status
+
+    for chunk in chunk_messages(messages):
+        send_message(bot, chunk)
+
+    last_statuses.update(changed)
+
+
+def poll_job(
+    bot: telegram.Bot,
+    timestamp: int,
+    last_statuses: Dict[Any, Optional[str]],
+) -> int:
+    """
+    Выполняет один цикл опроса API и уведомления.
+
+    Args:
+        bot (telegram.Bot): Объект бота, который отправляет сообщения.
+        timestamp (int): Временной штамп, начиная с которого
+            запрашиваются изменения.
+        last_statuses (Dict[Any, Optional[str]]): Последние обработанные
+            статусы по идентификатору работы.
+
+    Returns:
+        int: Временной штамп для следующего опроса.
+
+    """
+    response = get_api_answer(timestamp)
+    homeworks = check_response(response)
+    send_status_updates(bot, homeworks, last_statuses)
+
+    # Следующий запрос вернет только работы, измененные после
+    # текущего опроса, а не всю историю с момента запуска бота
+    return response.get("current_date", int(time.time()) - RETRY_PERIOD)
+
+
 def main():
     """Основная логика работы бота."""
-    if check_tokens():
-        logger.info("Переменные окружения заполнены.")
-    else:
-        logging.critical("Отсутствуют обязательные переменные окружения.")
+    try:
+        cfg = load_config()
+    except ConfigError:
         sys.exit(1)
 
+    global SESSION
+    SESSION = build_session(cfg)
+
     bot = telegram.Bot(token=TELEGRAM_TOKEN)
     timestamp = int(time.time())
-    last_status = ""
+    last_statuses: Dict[Any, Optional[str]] = {}
+    breaker = CircuitBreaker()
+    # Расписание опросов ведется по монотонным часам с шагом RETRY_PERIOD,
+    # поэтому время работы цикла и перевод системных часов его не сдвигают
+    next_poll = time.monotonic()
 
     while True:
-        try:
-            response = get_api_answer(timestamp)
-            homework = check_response(response)
-            if homework:
-                homework_status = parse_status(homework[0])
-                if homework_status != last_status:
-                    send_message(bot, homework_status)
-                    last_status = homework_status
-            elif last_status == "":
-                logger.info("Работ на проверке нет.")
-                send_message(bot, "Работ на проверке нет.")
-
-        except Exception as e:
-            message = f"Сбой в работе программы: {e}"
-            logger.error(message, exc_info=True)
-
-        finally:
-            time.sleep(RETRY_PERIOD)
+        if breaker.allow():
+            try:
+                timestamp = poll_job(bot, timestamp, last_statuses)
+                breaker.record_success()
+
+            except Exception as e:
+                # Трассировка стека нужна только для непредвиденных ошибок,
+                # ожидаемые сбои API логируются одной строкой
+                logger.error(
+                    "Сбой в работе программы: %s",
+                    e,
+                    exc_info=not isinstance(e, EXPECTED_ERRORS),
+                )
+                # Прерыватель учитывает только сбои API. Остальные ошибки
+                # возникают уже после ответа API, значит API доступен
+                if isinstance(e, EXPECTED_ERRORS):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+
+        if breaker.failures:
+            next_poll = time.monotonic() + breaker.delay()
+        else:
+            next_poll += RETRY_PERIOD
+
+        delay = next_poll - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            # Цикл занял больше периода: расписание начинается заново
+            next_poll = time.monotonic()
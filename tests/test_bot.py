@@ -156,7 +156,7 @@ class TestHomework:
             self.HOMEWORK_FUNC_WITH_PARAMS_QTY[func_name]
         )
 
-        def check_request_get_call(url,
+        def check_request_get_call(session, url,
                                    current_timestamp=current_timestamp,
                                    **kwargs):
             expected_url = (
@@ -165,14 +165,12 @@ class TestHomework:
             assert url.startswith(expected_url), (
                 'Проверьте адрес, на который отправляются запросы.'
             )
-            assert 'headers' in kwargs, (
-                'Проверьте, что в запрос к API передан заголовок.'
-            )
-            assert 'Authorization' in kwargs['headers'], (
+            headers = {**session.headers, **kwargs.get('headers', {})}
+            assert 'Authorization' in headers, (
                 'Проверьте, что в заголовках запроса передано поле '
                 '`Authorization`.'
             )
-            assert kwargs['headers']['Authorization'].startswith('OAuth '), (
+            assert headers['Authorization'].startswith('OAuth '), (
                 'Проверьте, что заголовок `Authorization` начинается с `OAuth`.'
             )
             assert 'params' in kwargs, (
@@ -192,7 +190,7 @@ class TestHomework:
                     'Проверьте, что в параметре `from_date` передано число.'
                 )
 
-        monkeypatch.setattr(requests, 'get', check_request_get_call)
+        monkeypatch.setattr(requests.Session, 'get', check_request_get_call)
         try:
             homework_module.get_api_answer(current_timestamp)
         except AssertionError as e:
@@ -215,7 +213,7 @@ class TestHomework:
                 current_timestamp=current_timestamp, **kwargs
             )
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(requests.Session, 'get', mock_response_get)
 
         result = homework_module.get_api_answer(current_timestamp)
         assert isinstance(result, dict), (
@@ -235,7 +233,7 @@ class TestHomework:
             self.HOMEWORK_FUNC_WITH_PARAMS_QTY[func_name]
         )
 
-        monkeypatch.setattr(requests, 'get', response)
+        monkeypatch.setattr(requests.Session, 'get', response)
         try:
             homework_module.get_api_answer(current_timestamp)
         except Exception:
@@ -259,7 +257,7 @@ class TestHomework:
         def mock_request_get_with_exception(*args, **kwargs):
             raise requests.RequestException('Something wrong')
 
-        monkeypatch.setattr(requests, 'get', mock_request_get_with_exception)
+        monkeypatch.setattr(requests.Session, 'get', mock_request_get_with_exception)
         try:
             homework_module.get_api_answer(current_timestamp)
         except requests.RequestException:
@@ -566,6 +564,9 @@ class TestHomework:
             raise utils.BreakInfiniteLoop('break')
 
         monkeypatch.setattr(time, 'sleep', sleep_to_interrupt)
+        # Пауза в `main()` отсчитывается по `time.monotonic()`, поэтому
+        # часы замораживаются, чтобы цикл длился ровно `RETRY_PERIOD`.
+        monkeypatch.setattr(time, 'monotonic', lambda: 0.0)
 
         def mock_telegram_bot(random_message=random_message, *args, **kwargs):
             return utils.MockTelegramBot(*args,
@@ -587,7 +588,7 @@ class TestHomework:
                 current_timestamp=current_timestamp, **kwargs
             )
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(requests.Session, 'get', mock_response_get)
 
     def test_main_without_env_vars_raise_exception(
             self, caplog, monkeypatch, random_timestamp, current_timestamp,
@@ -641,7 +642,7 @@ class TestHomework:
                     if record.message == utils.MockResponseGET.CALLED_LOG_MSG
                 ]
                 assert log_record, (
-                    'Убедитесь, что бот использует функцию `requests.get()` '
+                    'Убедитесь, что бот использует метод `Session.get()` '
                     'для отправки запроса к API домашки.'
                 )
 
@@ -724,7 +725,7 @@ class TestHomework:
                 data=data_with_new_hw_status
             ))
         monkeypatch.setattr(
-            requests,
+            requests.Session,
             'get',
             mock_response_get_with_new_status
         )
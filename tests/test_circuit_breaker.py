@@ -0,0 +1,173 @@
+import time
+
+import pytest
+import telegram
+
+from exceptions import EndPointError, SendMessageError
+from tests import utils
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(time, 'monotonic', clock)
+    return clock
+
+
+@pytest.fixture
+def run_main(monkeypatch, clock, homework_module):
+    """
+    Runs main() for a fixed sequence of polls and records the schedule.
+
+    Each outcome is either an exception raised by poll_job() or the number
+    of seconds a successful poll takes. Returns the requested sleeps and
+    the poll start times relative to the first poll.
+    """
+    monkeypatch.setattr(telegram, 'Bot', utils.MockTelegramBot)
+    monkeypatch.setattr(homework_module.random, 'uniform', lambda a, b: 0)
+
+    def run(outcomes):
+        outcomes = list(outcomes)
+        start = clock.now
+        sleeps, polls = [], []
+
+        def poll_job(bot, timestamp, last_statuses):
+            polls.append(clock.now - start)
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            clock.now += outcome
+            return timestamp
+
+        def sleep(secs):
+            sleeps.append(secs)
+            if not outcomes:
+                raise utils.BreakInfiniteLoop('break')
+            clock.now += secs
+
+        monkeypatch.setattr(homework_module, 'poll_job', poll_job)
+        monkeypatch.setattr(time, 'sleep', sleep)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        return sleeps, polls
+
+    return run
+
+
+@pytest.fixture
+def breaker(homework_module, clock):
+    return homework_module.CircuitBreaker(threshold=3, cooldown=3600)
+
+
+class TestCircuitBreaker:
+
+    def test_closed_without_failures(self, breaker, homework_module):
+        assert breaker.allow()
+        assert breaker.state == 'closed'
+        assert breaker.delay() == homework_module.RETRY_PERIOD
+
+    def test_backoff_before_threshold(self, breaker, homework_module):
+        retry_period = homework_module.RETRY_PERIOD
+        jitter = homework_module.RETRY_JITTER
+        breaker.record_failure()
+        assert breaker.state == 'closed'
+        assert 2 * retry_period <= breaker.delay() <= 2 * retry_period + jitter
+        breaker.record_failure()
+        assert breaker.state == 'closed'
+        assert 4 * retry_period <= breaker.delay() <= 4 * retry_period + jitter
+
+    def test_opens_after_threshold_for_exact_cooldown(self, breaker, clock,
+                                                      caplog):
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.state == 'open'
+        assert breaker.delay() == 3600
+        assert not breaker.allow()
+        assert 'приостановлен на 3600 с' in caplog.text
+
+        clock.now += 1000
+        assert breaker.delay() == 2600
+        assert not breaker.allow()
+
+    def test_half_open_probe_after_cooldown(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 3600
+        assert breaker.delay() == 0
+        assert breaker.allow()
+        assert breaker.state == 'half-open'
+
+    def test_successful_probe_closes(self, breaker, clock, homework_module):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 3600
+        breaker.allow()
+        breaker.record_success()
+        assert breaker.state == 'closed'
+        assert breaker.failures == 0
+        assert breaker.delay() == homework_module.RETRY_PERIOD
+
+    def test_failed_probe_reopens(self, breaker, clock, caplog):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 3600
+        breaker.allow()
+        caplog.clear()
+        breaker.record_failure()
+        assert breaker.state == 'open'
+        assert breaker.delay() == 3600
+        assert not breaker.allow()
+        assert 'Пробный запрос к API не удался' in caplog.text
+
+
+class TestMainLoopBreaker:
+
+    def test_api_errors_open_breaker(self, run_main, homework_module):
+        retry_period = homework_module.RETRY_PERIOD
+        cooldown = homework_module.BREAKER_COOLDOWN
+        sleeps, polls = run_main([EndPointError('API недоступен')] * 4)
+        assert sleeps == [2 * retry_period, 4 * retry_period,
+                          cooldown, cooldown]
+        assert polls == [0, 1200, 3600, 7200]
+
+    def test_other_errors_not_counted(self, run_main, homework_module):
+        sleeps, polls = run_main([TypeError('Неверный ответ')] * 4)
+        assert sleeps == [homework_module.RETRY_PERIOD] * 4
+        assert polls == [0, 600, 1200, 1800]
+
+    def test_other_error_after_recovery_closes_breaker(self, run_main,
+                                                       homework_module):
+        outcomes = (
+            [EndPointError('API недоступен')] * 3
+            + [SendMessageError('Telegram недоступен')] * 3
+        )
+        sleeps, polls = run_main(outcomes)
+        assert polls == [0, 1200, 3600, 7200, 7800, 8400]
+        assert sleeps[-3:] == [homework_module.RETRY_PERIOD] * 3
+
+
+class TestPollSchedule:
+
+    def test_sleep_excludes_poll_duration(self, run_main):
+        sleeps, polls = run_main([5, 5, 5])
+        assert sleeps == [595, 595, 595]
+        assert polls == [0, 600, 1200]
+
+    def test_overrun_poll_restarts_schedule(self, run_main):
+        sleeps, polls = run_main([700, 5, 5])
+        assert sleeps == [595, 595]
+        assert polls == [0, 700, 1300]
+
+    def test_cadence_restored_after_failure(self, run_main, homework_module):
+        retry_period = homework_module.RETRY_PERIOD
+        sleeps, polls = run_main([EndPointError('API недоступен'), 0, 0, 0])
+        assert sleeps == [2 * retry_period] + [retry_period] * 3
+        assert polls == [0, 1200, 1800, 2400]
@@ -0,0 +1,26 @@
+import pytest
+
+from exceptions import ConfigError
+
+
+class TestLoadConfig:
+
+    def test_missing_token_raises_config_error(self, monkeypatch,
+                                               homework_module):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', None)
+        monkeypatch.setattr(homework_module, 'SESSION', None)
+        with pytest.raises(ConfigError):
+            homework_module.load_config()
+        with pytest.raises(ConfigError):
+            homework_module.get_api_answer(0)
+
+    def test_headers_built_from_validated_token(self, monkeypatch,
+                                                homework_module):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abc')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        headers = dict(homework_module.HEADERS)
+        cfg = homework_module.load_config()
+        assert cfg.headers == {**headers, 'Authorization': 'OAuth sometoken'}
+        assert homework_module.HEADERS == headers
+        assert 'Authorization' not in homework_module.HEADERS
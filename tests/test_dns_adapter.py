@@ -0,0 +1,134 @@
+import socket
+
+import pytest
+import requests
+
+API_URL = 'https://example.test/api/'
+ADDRESS = '127.0.0.1'
+
+
+class Resolver:
+    def __init__(self, address=ADDRESS):
+        self.address = address
+        self.calls = []
+
+    def __call__(self, host):
+        self.calls.append(host)
+        if self.address is None:
+            raise socket.gaierror('Name or service not known')
+        return self.address
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    resolver = Resolver()
+    monkeypatch.setattr(socket, 'gethostbyname', resolver)
+    return resolver
+
+
+@pytest.fixture
+def adapter(homework_module):
+    adapter = homework_module.CachedDNSAdapter(dns_ttl=60)
+    yield adapter
+    adapter.close()
+
+
+class TestGetConnection:
+
+    def test_pool_opened_on_cached_address(self, adapter, resolver):
+        pool = adapter.get_connection(API_URL)
+        assert pool.host == ADDRESS
+        assert pool.port == 443
+        assert pool.assert_hostname == 'example.test'
+        assert pool.conn_kw['server_hostname'] == 'example.test'
+        assert adapter.get_connection(API_URL) is pool
+        assert resolver.calls == ['example.test']
+
+    def test_shared_pool_settings_not_changed(self, adapter, resolver):
+        before = dict(adapter.poolmanager.connection_pool_kw)
+        adapter.get_connection(API_URL)
+        assert adapter.poolmanager.connection_pool_kw == before
+
+        pool = adapter.get_connection('https://other.test/')
+        assert pool.assert_hostname == 'other.test'
+        assert pool.conn_kw['server_hostname'] == 'other.test'
+
+    def test_fallback_when_name_not_resolved(self, adapter, resolver):
+        resolver.address = None
+        pool = adapter.get_connection(API_URL)
+        assert pool.host == 'example.test'
+        assert 'server_hostname' not in pool.conn_kw
+        assert adapter.resolved == {}
+
+    def test_proxied_request_not_resolved(self, adapter, resolver):
+        proxies = {'https': 'http://proxy.test:3128'}
+        adapter.get_connection(API_URL, proxies)
+        assert resolver.calls == []
+
+    def test_address_resolved_again_after_ttl(self, monkeypatch, adapter,
+                                              resolver, homework_module):
+        now = [1000.0]
+        monkeypatch.setattr(homework_module.time, 'monotonic',
+                            lambda: now[0])
+        adapter.get_connection(API_URL)
+        now[0] += 30
+        adapter.get_connection(API_URL)
+        assert len(resolver.calls) == 1
+
+        resolver.address = '127.0.0.2'
+        now[0] += 31
+        pool = adapter.get_connection(API_URL)
+        assert len(resolver.calls) == 2
+        assert pool.host == '127.0.0.2'
+
+
+class TestSend:
+
+    @pytest.fixture
+    def request_(self):
+        return requests.Request('GET', API_URL).prepare()
+
+    def test_host_header_set_only_during_send(self, monkeypatch, adapter,
+                                              resolver, request_):
+        seen = {}
+
+        def parent_send(self, request, **kwargs):
+            seen['host'] = request.headers.get('Host')
+            return requests.Response()
+
+        monkeypatch.setattr(requests.adapters.HTTPAdapter, 'send',
+                            parent_send)
+        adapter.send(request_)
+        assert seen['host'] == 'example.test'
+        assert 'Host' not in request_.headers
+
+    @pytest.mark.parametrize('error', [
+        requests.ConnectionError, requests.ConnectTimeout,
+    ])
+    def test_connection_error_drops_cached_address(
+            self, monkeypatch, adapter, resolver, request_, error):
+        def parent_send(self, request, **kwargs):
+            raise error('connection refused')
+
+        monkeypatch.setattr(requests.adapters.HTTPAdapter, 'send',
+                            parent_send)
+        adapter.get_connection(API_URL)
+        with pytest.raises(error):
+            adapter.send(request_)
+        assert 'example.test' not in adapter.resolved
+        assert 'Host' not in request_.headers
+
+        adapter.get_connection(API_URL)
+        assert len(resolver.calls) == 2
+
+    def test_read_timeout_keeps_cached_address(self, monkeypatch, adapter,
+                                               resolver, request_):
+        def parent_send(self, request, **kwargs):
+            raise requests.ReadTimeout('read timed out')
+
+        monkeypatch.setattr(requests.adapters.HTTPAdapter, 'send',
+                            parent_send)
+        adapter.get_connection(API_URL)
+        with pytest.raises(requests.ReadTimeout):
+            adapter.send(request_)
+        assert 'example.test' in adapter.resolved
@@ -0,0 +1,136 @@
+import logging
+
+import pytest
+
+
+class RecordingBot:
+    def __init__(self):
+        self.sent = []
+
+    def send_message(self, chat_id=None, text=None, **kwargs):
+        self.sent.append(text)
+
+
+@pytest.fixture
+def bot():
+    return RecordingBot()
+
+
+class TestChunkMessages:
+
+    def test_empty(self, homework_module):
+        assert homework_module.chunk_messages([]) == []
+
+    def test_messages_packed_into_one_chunk(self, homework_module):
+        result = homework_module.chunk_messages(['a', 'b', 'c'])
+        assert result == ['a\n\nb\n\nc']
+
+    def test_split_by_limit(self, homework_module):
+        messages = ['a' * 6, 'b' * 6, 'c' * 2]
+        result = homework_module.chunk_messages(messages, limit=10)
+        assert result == ['a' * 6, 'b' * 6 + '\n\n' + 'c' * 2]
+        assert all(len(chunk) <= 10 for chunk in result)
+
+    def test_chunk_exactly_at_limit(self, homework_module):
+        result = homework_module.chunk_messages(['aaaa', 'bbbb'], limit=10)
+        assert result == ['aaaa\n\nbbbb']
+
+    def test_long_message_sent_alone(self, homework_module):
+        result = homework_module.chunk_messages(['a' * 20, 'b'], limit=10)
+        assert result == ['a' * 20, 'b']
+
+
+class TestSendStatusUpdates:
+    HOMEWORKS = [
+        {'id': 1, 'homework_name': 'hw1', 'status': 'approved'},
+        {'id': 2, 'homework_name': 'hw2', 'status': 'reviewing'},
+    ]
+
+    def test_changes_batched_into_one_message(self, bot, homework_module):
+        last_statuses = {}
+        homework_module.send_status_updates(
+            bot, self.HOMEWORKS, last_statuses
+        )
+        assert len(bot.sent) == 1
+        assert '"hw1"' in bot.sent[0] and '"hw2"' in bot.sent[0]
+        assert last_statuses == {1: 'approved', 2: 'reviewing'}
+
+    def test_batch_split_by_telegram_limit(self, bot, homework_module):
+        homeworks = [
+            {'id': 1, 'homework_name': 'a' * 3000, 'status': 'approved'},
+            {'id': 2, 'homework_name': 'b' * 3000, 'status': 'rejected'},
+        ]
+        homework_module.send_status_updates(bot, homeworks, {})
+        assert len(bot.sent) == 2
+        assert all(
+            len(message) <= homework_module.TELEGRAM_MESSAGE_LIMIT
+            for message in bot.sent
+        )
+
+    def test_only_changed_statuses_sent(self, bot, homework_module):
+        last_statuses = {1: 'approved', 2: 'approved'}
+        homework_module.send_status_updates(
+            bot, self.HOMEWORKS, last_statuses
+        )
+        assert len(bot.sent) == 1
+        assert '"hw1"' not in bot.sent[0]
+        assert '"hw2"' in bot.sent[0]
+        assert last_statuses == {1: 'approved', 2: 'reviewing'}
+
+    def test_statuses_tracked_per_id(self, bot, homework_module):
+        homeworks = [
+            {'id': 1, 'homework_name': 'hw', 'status': 'approved'},
+            {'id': 2, 'homework_name': 'hw', 'status': 'rejected'},
+        ]
+        last_statuses = {}
+        homework_module.send_status_updates(bot, homeworks, last_statuses)
+        homework_module.send_status_updates(bot, homeworks, last_statuses)
+        assert len(bot.sent) == 1
+        assert last_statuses == {1: 'approved', 2: 'rejected'}
+
+    def test_invalid_homework_does_not_block_batch(self, bot, caplog,
+                                                   homework_module):
+        homeworks = [
+            {'id': 2, 'homework_name': 'hw2', 'status': 'approved'},
+            {'id': 3, 'homework_name': 'hw3', 'status': 'weird'},
+        ]
+        last_statuses = {}
+        with caplog.at_level(logging.ERROR):
+            homework_module.send_status_updates(
+                bot, homeworks, last_statuses
+            )
+        assert len(bot.sent) == 1
+        assert '"hw2"' in bot.sent[0]
+        assert last_statuses == {2: 'approved', 3: 'weird'}
+        assert any('weird' in record.message for record in caplog.records)
+
+        homework_module.send_status_updates(bot, homeworks, last_statuses)
+        assert len(bot.sent) == 1
+
+    def test_homework_without_status_reported(self, bot, caplog,
+                                              homework_module):
+        homeworks = [{'id': 4, 'homework_name': 'hw4'}]
+        last_statuses = {}
+        with caplog.at_level(logging.ERROR):
+            homework_module.send_status_updates(
+                bot, homeworks, last_statuses
+            )
+        assert bot.sent == []
+        assert last_statuses == {4: None}
+        assert any('status' in record.message for record in caplog.records)
+
+    def test_poll_advances_timestamp_with_invalid_homework(
+            self, bot, monkeypatch, homework_module):
+        response = {
+            'homeworks': [
+                {'id': 2, 'homework_name': 'hw2', 'status': 'approved'},
+                {'id': 3, 'homework_name': 'hw3', 'status': 'weird'},
+            ],
+            'current_date': 1000198991,
+        }
+        monkeypatch.setattr(
+            homework_module, 'get_api_answer', lambda timestamp: response
+        )
+        timestamp = homework_module.poll_job(bot, 1000198000, {})
+        assert timestamp == response['current_date']
+        assert len(bot.sent) == 1